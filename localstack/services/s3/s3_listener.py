@@ -12,14 +12,12 @@ from urllib.parse import parse_qs
 
 import botocore.config
 import dateutil.parser
-import six
 import xmltodict
 from botocore.client import ClientError
 from moto.s3.exceptions import InvalidFilterRuleName
 from moto.s3.models import s3_backend
 from pytz import timezone
 from requests.models import Request, Response
-from six.moves.urllib import parse as urlparse
 
 from localstack import config, constants
 from localstack.services.s3 import multipart_content
@@ -259,7 +257,7 @@ def send_notification_for_subscriber(
     ):
         return
 
-    key = urlparse.unquote(object_path.replace("//", "/"))[1:]
+    key = urllib.parse.unquote(object_path.replace("//", "/"))[1:]
 
     s3_client = aws_stack.connect_to_service("s3")
     object_data = {}
@@ -601,8 +599,8 @@ def append_list_objects_marker(method, path, data, response):
         marker = ""
         content = to_str(response.content)
         if "<ListBucketResult" in content and "<Marker>" not in content:
-            parsed = urlparse.urlparse(path)
-            query_map = urlparse.parse_qs(parsed.query)
+            parsed = urllib.parse.urlparse(path)
+            query_map = urllib.parse.parse_qs(parsed.query)
             if query_map.get("marker") and query_map.get("marker")[0]:
                 marker = query_map.get("marker")[0]
             insert = "<Marker>%s</Marker>" % marker
@@ -641,7 +639,7 @@ def fix_range_content_type(bucket_name, path, headers, response):
         return
 
     s3_client = aws_stack.connect_to_service("s3")
-    path = urlparse.urlparse(urlparse.unquote(path)).path
+    path = urllib.parse.urlparse(urllib.parse.unquote(path)).path
     key_name = extract_key_name(headers, path)
     result = s3_client.head_object(Bucket=bucket_name, Key=key_name)
     content_type = result["ContentType"]
@@ -816,7 +814,7 @@ def set_lifecycle(bucket_name, lifecycle):
     if not exists:
         return xml_response(body, status_code=code)
 
-    if isinstance(to_str(lifecycle), six.string_types):
+    if isinstance(to_str(lifecycle), str):
         lifecycle = xmltodict.parse(lifecycle)
     BUCKET_LIFECYCLE[bucket_name] = lifecycle
     return 200
@@ -838,7 +836,7 @@ def set_replication(bucket_name, replication):
     if not exists:
         return xml_response(body, status_code=code)
 
-    if isinstance(to_str(replication), six.string_types):
+    if isinstance(to_str(replication), str):
         replication = xmltodict.parse(replication)
     BUCKET_REPLICATIONS[bucket_name] = replication
     return 200
@@ -901,7 +899,6 @@ def bucket_exists(bucket_name):
 
 
 def check_content_md5(data, headers):
-    actual = md5(strip_chunk_signatures(data))
     try:
         md5_header = headers["Content-MD5"]
         if not is_base64(md5_header):
@@ -913,6 +910,8 @@ def check_content_md5(data, headers):
             "InvalidDigest",
             status_code=400,
         )
+    # only compute the (potentially expensive) payload hash once the header has been validated
+    actual = md5(strip_chunk_signatures(data))
     if actual != expected:
         return error_response(
             "The Content-MD5 you specified did not match what we received.",
@@ -975,17 +974,17 @@ def token_expired_error(resource, requestId=None, status_code=400):
 
 def expand_redirect_url(starting_url, key, bucket):
     """Add key and bucket parameters to starting URL query string."""
-    parsed = urlparse.urlparse(starting_url)
-    query = collections.OrderedDict(urlparse.parse_qsl(parsed.query))
+    parsed = urllib.parse.urlparse(starting_url)
+    query = collections.OrderedDict(urllib.parse.parse_qsl(parsed.query))
     query.update([("key", key), ("bucket", bucket)])
 
-    redirect_url = urlparse.urlunparse(
+    redirect_url = urllib.parse.urlunparse(
         (
             parsed.scheme,
             parsed.netloc,
             parsed.path,
             parsed.params,
-            urlparse.urlencode(query),
+            urllib.parse.urlencode(query),
             None,
         )
     )
@@ -1087,7 +1086,7 @@ def handle_put_bucket_notification(bucket, data):
         configs = config if isinstance(config, list) else [config] if config else []
         for config in configs:
             events = config.get("Event")
-            if isinstance(events, six.string_types):
+            if isinstance(events, str):
                 events = [events]
             event_filter = config.get("Filter", {})
             # make sure FilterRule is an array
@@ -1147,7 +1146,7 @@ class ProxyListenerS3(PersistingProxyListener):
                 """.format(
             protocol=get_service_protocol(),
             host=config.HOSTNAME_EXTERNAL,
-            encoded_key=urlparse.quote(key, safe=""),
+            encoded_key=urllib.parse.quote(key, safe=""),
             key=key,
             bucket=bucket_name,
             etag="d41d8cd98f00b204e9800998ecf8427f",
@@ -1198,14 +1197,14 @@ class ProxyListenerS3(PersistingProxyListener):
 
     def forward_request(self, method, path, data, headers):
         # Create list of query parameteres from the url
-        parsed = urlparse.urlparse("{}{}".format(config.get_edge_url(), path))
+        parsed = urllib.parse.urlparse("{}{}".format(config.get_edge_url(), path))
         query_params = parse_qs(parsed.query)
         path_orig = path
         path = path.replace(
             "#", "%23"
         )  # support key names containing hashes (e.g., required by Amplify)
         # extracting bucket name from the request
-        parsed_path = urlparse.urlparse(path)
+        parsed_path = urllib.parse.urlparse(path)
         bucket_name = extract_bucket_name(headers, parsed_path.path)
 
         if method == "PUT" and bucket_name and not re.match(BUCKET_NAME_REGEX, bucket_name):
@@ -1283,7 +1282,7 @@ class ProxyListenerS3(PersistingProxyListener):
         # parse query params
         query = parsed_path.query
         path = parsed_path.path
-        query_map = urlparse.parse_qs(query, keep_blank_values=True)
+        query_map = urllib.parse.parse_qs(query, keep_blank_values=True)
 
         # remap metadata query params (not supported in moto) to request headers
         append_metadata_headers(method, query_map, headers)
@@ -1405,7 +1404,7 @@ class ProxyListenerS3(PersistingProxyListener):
                 response.status_code = 200
                 return response
 
-        parsed = urlparse.urlparse(path)
+        parsed = urllib.parse.urlparse(path)
         bucket_name_in_host = uses_host_addressing(headers)
         should_send_notifications = all(
             [
@@ -1529,13 +1528,13 @@ class ProxyListenerS3(PersistingProxyListener):
                     exists, code, body = is_bucket_available(bucket_name)
                     if not exists:
                         return no_such_bucket(bucket_name, headers.get("x-amz-request-id"), 404)
-                query_map = urlparse.parse_qs(parsed.query, keep_blank_values=True)
+                query_map = urllib.parse.parse_qs(parsed.query, keep_blank_values=True)
                 for param_name, header_name in ALLOWED_HEADER_OVERRIDES.items():
                     if param_name in query_map:
                         response.headers[header_name] = query_map[param_name][0]
 
             if response_content_str and response_content_str.startswith("<"):
-                is_bytes = isinstance(response._content, six.binary_type)
+                is_bytes = isinstance(response._content, bytes)
                 response._content = response_content_str
 
                 append_last_modified_headers(response=response, content=response_content_str)
@@ -7,6 +7,7 @@ from binascii import crc32
 from struct import pack
 from typing import Dict, Optional, Union
 from urllib.parse import parse_qs
+from xml.sax.saxutils import escape as xml_escape
 
 import xmltodict
 from flask import Response as FlaskResponse
@@ -82,49 +83,57 @@ def requests_error_response_xml(
 
 def to_xml(data: dict, memberize: bool = True) -> ET.Element:
     """Generate XML element hierarchy out of dict. Wraps list items in <member> tags by default"""
+    return ET.fromstring(to_xml_str(data, memberize=memberize))
+
+
+def to_xml_str(data: dict, memberize: bool = True) -> str:
+    """Generate XML string out of dict. Wraps list items in <member> tags by default; with
+    memberize=False, the items of a list are written one after another into the parent element"""
     if not isinstance(data, dict) or len(data.keys()) != 1:
         raise Exception("Expected data to be a dict with a single root element")
 
-    def _to_xml(parent_el: ET.Element, data_rest) -> None:
+    parts = []
+
+    def _write_element(tag: str, data_rest) -> None:
+        start = len(parts)
+        parts.append("<%s>" % tag)
+        _write_content(data_rest)
+        if len(parts) == start + 1:
+            parts[start] = "<%s />" % tag
+        else:
+            parts.append("</%s>" % tag)
+
+    def _write_content(data_rest) -> None:
         if isinstance(data_rest, list):
             for i in data_rest:
-                member_el = ET.SubElement(parent_el, "member") if memberize else parent_el
-                _to_xml(member_el, i)
+                if memberize and isinstance(i, str) and i:
+                    # fast path for the common case of lists of (non-empty) strings
+                    parts.append("<member>%s</member>" % xml_escape(i))
+                elif memberize:
+                    _write_element("member", i)
+                else:
+                    _write_content(i)
         elif isinstance(data_rest, dict):
-            for key in data_rest:
-                value = data_rest[key]
-                curr_el = ET.SubElement(parent_el, key)
-                _to_xml(curr_el, value)
-        elif isinstance(data_rest, str):
-            parent_el.text = data_rest
-        elif any(
-            [isinstance(data_rest, i) for i in [bool, str, int, float]]
-        ):  # limit types for text serialization
-            parent_el.text = str(data_rest)
-        else:
-            if data_rest is not None:  # None is just ignored and omitted
-                raise Exception(f"Unexpected type for value encountered: {type(data_rest)}")
+            for key, value in data_rest.items():
+                _write_element(key, value)
+        elif isinstance(data_rest, (bool, str, int, float)):  # limit types for text serialization
+            text = data_rest if isinstance(data_rest, str) else str(data_rest)
+            if text:
+                parts.append(xml_escape(text))
+        elif data_rest is not None:  # None is just ignored and omitted
+            raise Exception(f"Unexpected type for value encountered: {type(data_rest)}")
 
     root_key = list(data.keys())[0]
-    root = ET.Element(root_key)
-    _to_xml(root, data[root_key])
-    return root
+    _write_element(root_key, data[root_key])
+    return "".join(parts)
 
 
 def requests_response_xml(action, response, xmlns=None, service=None, memberize=True):
     xmlns = xmlns or "http://%s.amazonaws.com/doc/2010-03-31/" % service
     response = json_safe(response)
     response = {"{action}Result".format(action=action): response}
-    response = ET.tostring(to_xml(response, memberize=memberize), short_empty_elements=True)
-    response = to_str(response)
-    result = (
-        """
-        <{action}Response xmlns="{xmlns}">
-            {response}
-        </{action}Response>
-        """
-    ).strip()
-    result = result.format(action=action, xmlns=xmlns, response=response)
+    response = to_xml_str(response, memberize=memberize)
+    result = f'<{action}Response xmlns="{xmlns}">{response}</{action}Response>'
     result = requests_response(result)
     return result
 
@@ -26,11 +26,10 @@ from datetime import date, datetime, timezone, tzinfo
 from multiprocessing.dummy import Pool
 from queue import Queue
 from typing import Any, Callable, Dict, List, Optional, Sized, Type, Union
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qsl, urlparse
 
 import dns.resolver
 import requests
-import six
 from requests import Response
 
 import localstack.utils.run
@@ -104,7 +103,7 @@ class CustomEncoder(json.JSONEncoder):
                 return bool(o.value)
             return str(o.value)
         try:
-            if isinstance(o, six.binary_type):
+            if isinstance(o, bytes):
                 return to_str(o)
             return super(CustomEncoder, self).default(o)
         except Exception:
@@ -522,18 +521,16 @@ def prevent_stack_overflow(match_parameters=False):
     return _decorator
 
 
-def is_string(s, include_unicode=True, exclude_binary=False):
-    if isinstance(s, six.binary_type) and exclude_binary:
+def is_string(s, exclude_binary=False):
+    if isinstance(s, bytes) and exclude_binary:
         return False
     if isinstance(s, str):
         return True
-    if include_unicode and isinstance(s, six.text_type):
-        return True
     return False
 
 
 def is_string_or_bytes(s):
-    return is_string(s) or isinstance(s, six.string_types) or isinstance(s, bytes)
+    return is_string(s) or isinstance(s, bytes)
 
 
 def is_base64(s):
@@ -609,7 +606,7 @@ def is_port_open(port_or_url, http_path=None, expect_success=True, protocols=Non
     host = "localhost"
     protocol = "http"
     protocols = protocols if isinstance(protocols, list) else [protocols]
-    if isinstance(port, six.string_types):
+    if isinstance(port, str):
         url = urlparse(port_or_url)
         port = url.port
         host = url.hostname
@@ -753,7 +750,7 @@ def to_unique_items_list(inputs, comparator=None):
 def timestamp(time=None, format: str = TIMESTAMP_FORMAT) -> str:
     if not time:
         time = datetime.utcnow()
-    if isinstance(time, six.integer_types + (float,)):
+    if isinstance(time, (int, float)):
         time = datetime.fromtimestamp(time)
     return time.strftime(format)
 
@@ -877,6 +874,7 @@ def keys_to_lower(obj, skip_children_of=None):
     return result
 
 
+@functools.lru_cache()
 def camel_to_snake_case(string):
     return re.sub(r"(?<!^)(?=[A-Z])", "_", string).replace("__", "_").lower()
 
@@ -1145,13 +1143,20 @@ def parse_request_data(method, path, data=None, headers=None):
     if method in ["POST", "PUT", "PATCH"] and (not content_type or "form-" in content_type):
         # content-type could be either "application/x-www-form-urlencoded" or "multipart/form-data"
         try:
-            result = parse_qs(to_str(data or ""))
+            result = _parse_qs_first_values(to_str(data or ""))
         except Exception:
             pass  # probably binary / JSON / non-URL encoded payload - ignore
     if not result:
         parsed_path = urlparse(path)
-        result = parse_qs(parsed_path.query)
-    result = dict([(k, v[0]) for k, v in result.items()])
+        result = _parse_qs_first_values(parsed_path.query)
+    return result
+
+
+def _parse_qs_first_values(query: str) -> Dict[str, str]:
+    """Parse the given query string into a dict, keeping only the first value of each parameter."""
+    result = {}
+    for key, value in parse_qsl(query):
+        result.setdefault(key, value)
     return result
 
 
@@ -1324,7 +1329,7 @@ def extract_from_jsonpointer_path(target, path: str, delimiter: str = "/", auto_
 
 def save_file(file, content, append=False):
     mode = "a" if append else "w+"
-    if not isinstance(content, six.string_types):
+    if not isinstance(content, str):
         mode = mode + "b"
     # make sure that the parent dir exsits
     mkdir(os.path.dirname(file))
@@ -1364,15 +1369,15 @@ def replace_in_file(search, replace, file_path):
 
 
 def to_str(obj: Union[str, bytes], encoding: str = DEFAULT_ENCODING, errors="strict") -> str:
-    """If ``obj`` is an instance of ``binary_type``, return
+    """If ``obj`` is an instance of ``bytes``, return
     ``obj.decode(encoding, errors)``, otherwise return ``obj``"""
-    return obj.decode(encoding, errors) if isinstance(obj, six.binary_type) else obj
+    return obj.decode(encoding, errors) if isinstance(obj, bytes) else obj
 
 
 def to_bytes(obj: Union[str, bytes], encoding: str = DEFAULT_ENCODING, errors="strict") -> bytes:
-    """If ``obj`` is an instance of ``text_type``, return
+    """If ``obj`` is an instance of ``str``, return
     ``obj.encode(encoding, errors)``, otherwise return ``obj``"""
-    return obj.encode(encoding, errors) if isinstance(obj, six.text_type) else obj
+    return obj.encode(encoding, errors) if isinstance(obj, str) else obj
 
 
 def str_to_bool(value):
@@ -1837,7 +1842,7 @@ class _RequestsSafe(type):
 
 
 # create class-of-a-class
-class safe_requests(six.with_metaclass(_RequestsSafe)):
+class safe_requests(metaclass=_RequestsSafe):
     pass
 
 
@@ -1849,15 +1854,6 @@ def make_http_request(
     )
 
 
-class SafeStringIO(io.StringIO):
-    """Safe StringIO implementation that doesn't fail if str is passed in Python 2."""
-
-    def write(self, obj):
-        if six.PY2 and isinstance(obj, str):
-            obj = obj.decode("unicode-escape")
-        return super(SafeStringIO, self).write(obj)
-
-
 def clean_cache(file_pattern=CACHE_FILE_PATTERN, last_clean_time=None, max_age=CACHE_MAX_AGE):
     if last_clean_time is None:
         last_clean_time = last_cache_clean_time
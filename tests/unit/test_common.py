@@ -269,6 +269,15 @@ class TestCommon(unittest.TestCase):
         self.assertEqual("FooBar", fn("foo__bar"))
         self.assertEqual("FooBAR", fn("foo_b_a_r"))
 
+    def test_parse_request_data(self):
+        fn = common.parse_request_data
+
+        data = "Action=SendMessage&MessageBody=foo+bar%21&Action=Ignored"
+        expected = {"Action": "SendMessage", "MessageBody": "foo bar!"}
+        self.assertEqual(expected, fn("POST", "/", data))
+        self.assertEqual(expected, fn("GET", "/?%s" % data))
+        self.assertEqual({"Action": "Foo"}, fn("POST", "/?Action=Foo", ""))
+
     def test_obj_to_xml(self):
         fn = common.obj_to_xml
         # primitive
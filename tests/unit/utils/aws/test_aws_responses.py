@@ -2,7 +2,8 @@ import xml.etree.ElementTree as ET
 
 import pytest
 
-from localstack.utils.aws.aws_responses import to_xml
+from localstack.utils.aws.aws_responses import requests_response_xml, to_xml, to_xml_str
+from localstack.utils.common import to_str
 
 result_raw = {
     "DescribeChangeSetResult": {
@@ -43,6 +44,47 @@ def test_to_xml(test_input, included):
     assert included in result_str
 
 
+@pytest.mark.parametrize(
+    "test_input,memberize,expected",
+    [
+        (
+            result_raw,
+            True,
+            "<DescribeChangeSetResult><Changes><member><ResourceChange>"
+            "<Replacement>False</Replacement><Scope><member>Tags</member></Scope>"
+            "</ResourceChange><Type>Resource</Type></member></Changes></DescribeChangeSetResult>",
+        ),
+        (result_raw_none_element, True, "<a><b /></a>"),
+        (result_raw_empty_list, True, "<a><b /></a>"),
+        (result_raw_multiple_members, True, "<a><b><member>c</member><member>d</member></b></a>"),
+        (
+            {"a": {"b": "<escaped & text>", "c": "", "d": 1.5, "e": [None, {}]}},
+            True,
+            "<a><b>&lt;escaped &amp; text&gt;</b><c /><d>1.5</d><e><member /><member /></e></a>",
+        ),
+        # non-ASCII characters are written as-is, not as numeric character references
+        ({"a": {"b": "Grüße"}}, True, "<a><b>Grüße</b></a>"),
+        # without memberize, list items are written one after another into the parent element
+        ({"a": {"d": [1, "", None, "s"]}}, False, "<a><d>1s</d></a>"),
+        ({"a": {"d": ["x", {"k": "v"}, "y"]}}, False, "<a><d>x<k>v</k>y</d></a>"),
+        ({"a": {"d": [{"k": "v"}, {"k": "w"}]}}, False, "<a><d><k>v</k><k>w</k></d></a>"),
+    ],
+)
+def test_to_xml_str(test_input, memberize, expected):
+    assert to_xml_str(test_input, memberize=memberize) == expected
+    # to_xml(..) is built from the same serialization
+    assert ET.tostring(to_xml(test_input, memberize=memberize), encoding="unicode") == expected
+
+
+def test_requests_response_xml():
+    response = requests_response_xml("DescribeFoo", {"Bar": ["a", "ü"]}, xmlns="http://xmlns")
+    expected = (
+        '<DescribeFooResponse xmlns="http://xmlns"><DescribeFooResult>'
+        "<Bar><member>a</member><member>ü</member></Bar></DescribeFooResult></DescribeFooResponse>"
+    )
+    assert to_str(response.content) == expected
+
+
 @pytest.mark.parametrize(
     "test_input", [lambda: None, lambda: [], lambda: "", lambda: 0]
 )  # direct literals here trip up pytest
@@ -64,3 +106,5 @@ empty_dict = {}
 def test_to_xml_raise_error_malformeddict(test_input):
     with pytest.raises(Exception):
         to_xml(test_input)
+    with pytest.raises(Exception):
+        to_xml_str(test_input)